@@ -0,0 +1,14 @@
+-- Wake long-polling brains (POST /brains/jobs/pull with wait_ms) as soon as a job becomes pending.
+CREATE OR REPLACE FUNCTION notify_brain_job_pending() RETURNS trigger AS $$
+BEGIN
+  PERFORM pg_notify('brain_jobs', NEW.agent_id::text);
+  RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_brain_jobs_notify ON brain_jobs;
+CREATE TRIGGER trg_brain_jobs_notify
+  AFTER INSERT OR UPDATE OF status ON brain_jobs
+  FOR EACH ROW
+  WHEN (NEW.status = 'pending')
+  EXECUTE FUNCTION notify_brain_job_pending();
@@ -0,0 +1,4 @@
+-- Streaming DIALOGUE: brains push partial results (e.g. the first lines) before the final submit.
+ALTER TABLE brain_jobs
+  ADD COLUMN IF NOT EXISTS partial JSONB,
+  ADD COLUMN IF NOT EXISTS partial_at TIMESTAMP WITH TIME ZONE;
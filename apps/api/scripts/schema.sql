@@ -283,6 +283,8 @@ CREATE TABLE brain_jobs (
   lease_expires_at TIMESTAMP WITH TIME ZONE,
   leased_at TIMESTAMP WITH TIME ZONE,
   result JSONB,
+  partial JSONB,
+  partial_at TIMESTAMP WITH TIME ZONE,
   error TEXT,
   finished_at TIMESTAMP WITH TIME ZONE,
   created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
@@ -292,6 +294,20 @@ CREATE TABLE brain_jobs (
 CREATE INDEX idx_brain_jobs_agent_status_created ON brain_jobs(agent_id, status, created_at ASC);
 CREATE INDEX idx_brain_jobs_status_error ON brain_jobs(status, last_error_code, updated_at DESC);
 
+-- Wake long-polling brains as soon as a job becomes pending.
+CREATE OR REPLACE FUNCTION notify_brain_job_pending() RETURNS trigger AS $$
+BEGIN
+  PERFORM pg_notify('brain_jobs', NEW.agent_id::text);
+  RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER trg_brain_jobs_notify
+  AFTER INSERT OR UPDATE OF status ON brain_jobs
+  FOR EACH ROW
+  WHEN (NEW.status = 'pending')
+  EXECUTE FUNCTION notify_brain_job_pending();
+
 -- ============================================================
 -- LIMBOPET BYOK (Phase 1.5)
 -- Store user-provided model credentials (encrypted at rest).
@@ -206,7 +206,12 @@ const config = {
 
   // Brain jobs
   brain: {
-    leaseSeconds: 120
+    leaseSeconds: 120,
+    // Upper bounds for the batch endpoints (POST /brains/jobs/pull-batch, /brains/jobs/submit-batch).
+    maxPullBatch: 20,
+    maxSubmitBatch: 50,
+    // Longest a pull may be held open waiting for work (`wait_ms`). Keep below proxy idle timeouts.
+    maxLongPollMs: 25000
   },
   
   // Pagination defaults
@@ -7,6 +7,7 @@ const config = require('./config');
 const { initializePool, healthCheck } = require('./config/database');
 const ServerBrainWorker = require('./services/ServerBrainWorker');
 const WorldTickWorker = require('./services/WorldTickWorker');
+const BrainJobNotifier = require('./services/BrainJobNotifier');
 const { execSync } = require('child_process');
 const path = require('path');
 
@@ -68,6 +69,8 @@ async function start() {
     
     if (dbHealthy) {
       console.log('Database connected');
+      // Long-poll wakeups for local brains (best-effort; pull falls back to re-checking).
+      void BrainJobNotifier.start();
     } else {
       console.warn('Database not available, running in limited mode');
     }
@@ -130,6 +133,11 @@ async function shutdown(signal) {
     } catch {
       // ignore
     }
+    try {
+      await BrainJobNotifier.stop();
+    } catch {
+      // ignore
+    }
 
     await new Promise((resolve) => {
       if (!server) return resolve();
@@ -8,10 +8,24 @@ const { asyncHandler } = require('../middleware/errorHandler');
 const { requireAuth } = require('../middleware/auth');
 const { success } = require('../utils/response');
 const BrainJobService = require('../services/BrainJobService');
+const BrainJobNotifier = require('../services/BrainJobNotifier');
 const { isValidUUID } = require('../utils/validators');
+const config = require('../config');
 
 const router = Router();
 
+function waitOptions(req, res) {
+  // `res` (not `req`) 'close' before we respond means the brain disconnected mid long-poll.
+  let closed = false;
+  res.on('close', () => {
+    closed = true;
+  });
+  return {
+    waitMs: req.body?.wait_ms ?? req.query?.wait_ms ?? 0,
+    isCancelled: () => closed
+  };
+}
+
 function validateId(req, res) {
   if (!isValidUUID(req.params?.id)) {
     res.status(400).json({ error: 'Invalid ID format' });
@@ -20,13 +34,69 @@ function validateId(req, res) {
   return true;
 }
 
+/**
+ * GET /brains/capabilities
+ * Lets local brains discover optional protocol features (older servers 404 here).
+ */
+router.get('/capabilities', requireAuth, asyncHandler(async (req, res) => {
+  success(res, {
+    capabilities: {
+      batch: {
+        max_pull: Number(config.brain?.maxPullBatch) || 20,
+        max_submit: Number(config.brain?.maxSubmitBatch) || 50
+      },
+      partial: {
+        job_types: ['DIALOGUE']
+      },
+      long_poll: {
+        max_wait_ms: Number(config.brain?.maxLongPollMs) || 25000,
+        push: BrainJobNotifier.listening
+      }
+    }
+  });
+}));
+
 /**
  * POST /brains/jobs/pull
  * Local brain polls for work.
+ * Optional `wait_ms` (body or query): hold the request until a job is available (long-poll).
  */
 router.post('/jobs/pull', requireAuth, asyncHandler(async (req, res) => {
-  const job = await BrainJobService.pullNextJob(req.agent.id);
-  success(res, { job });
+  const agentId = req.agent.id;
+  const job = await BrainJobService.pullWithWait(agentId, () => BrainJobService.pullNextJob(agentId), waitOptions(req, res));
+  if (res.writableEnded || res.destroyed) return;
+  success(res, { job: job || null });
+}));
+
+/**
+ * POST /brains/jobs/pull-batch
+ * Lease up to `limit` jobs in one round trip (supports `wait_ms` like /jobs/pull).
+ */
+router.post('/jobs/pull-batch', requireAuth, asyncHandler(async (req, res) => {
+  const agentId = req.agent.id;
+  const limit = req.body?.limit;
+  const jobs = await BrainJobService.pullWithWait(agentId, () => BrainJobService.pullNextJobs(agentId, { limit }), waitOptions(req, res));
+  if (res.writableEnded || res.destroyed) return;
+  success(res, { jobs: jobs || [] });
+}));
+
+/**
+ * POST /brains/jobs/:id/partial
+ * Streaming brains push partial results (e.g. DIALOGUE lines so far) while generating.
+ */
+router.post('/jobs/:id/partial', requireAuth, asyncHandler(async (req, res) => {
+  if (!validateId(req, res)) return;
+  const job = await BrainJobService.submitPartial(req.agent.id, req.params.id, req.body?.partial);
+  success(res, { job, accepted: Boolean(job) });
+}));
+
+/**
+ * POST /brains/jobs/submit-batch
+ * Submit many results; `results[i].ok` reports per-job success.
+ */
+router.post('/jobs/submit-batch', requireAuth, asyncHandler(async (req, res) => {
+  const results = await BrainJobService.submitJobs(req.agent.id, req.body?.results);
+  success(res, { results });
 }));
 
 /**
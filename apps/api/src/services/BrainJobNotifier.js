@@ -0,0 +1,139 @@
+/**
+ * BrainJobNotifier
+ *
+ * Long-poll support for local brains.
+ *
+ * Holds one dedicated pg connection with `LISTEN brain_jobs` (see migration 0023)
+ * and wakes waiting pull requests for the agent whose job just became pending.
+ *
+ * If LISTEN is unavailable (no DB / connection lost), waiters fall back to a short
+ * re-check interval, so long-poll degrades to fast server-side polling instead of failing.
+ */
+
+const { EventEmitter } = require('events');
+const { getPool } = require('../config/database');
+
+const CHANNEL = 'brain_jobs';
+const FALLBACK_RECHECK_MS = 250;
+const RECONNECT_MS = 5000;
+
+class BrainJobNotifier {
+  constructor() {
+    this._emitter = new EventEmitter();
+    this._emitter.setMaxListeners(0);
+    this._client = null;
+    this._starting = null;
+    this._stopped = false;
+    this._reconnectTimer = null;
+  }
+
+  get listening() {
+    return Boolean(this._client);
+  }
+
+  async start() {
+    this._stopped = false;
+    if (this._client) return true;
+    if (this._starting) return this._starting;
+
+    this._starting = (async () => {
+      const pool = getPool();
+      if (!pool) return false;
+      try {
+        const client = await pool.connect();
+        client.on('notification', (msg) => {
+          if (msg?.channel !== CHANNEL) return;
+          const agentId = String(msg.payload || '').trim();
+          if (agentId) this._emitter.emit(agentId);
+        });
+        client.on('error', (err) => {
+          console.warn('[brain-notifier] connection error:', err?.message || err);
+          this._drop(client, true);
+        });
+        await client.query(`LISTEN ${CHANNEL}`);
+        this._client = client;
+        return true;
+      } catch (e) {
+        console.warn('[brain-notifier] LISTEN failed, long-poll will re-check periodically:', e?.message || e);
+        this._scheduleReconnect();
+        return false;
+      } finally {
+        this._starting = null;
+      }
+    })();
+
+    return this._starting;
+  }
+
+  async stop() {
+    this._stopped = true;
+    if (this._reconnectTimer) clearTimeout(this._reconnectTimer);
+    this._reconnectTimer = null;
+    const client = this._client;
+    this._client = null;
+    if (!client) return;
+    try {
+      await client.query(`UNLISTEN ${CHANNEL}`);
+    } catch {
+      // ignore
+    }
+    client.release();
+  }
+
+  _drop(client, destroy) {
+    if (this._client !== client) return;
+    this._client = null;
+    try {
+      client.release(destroy ? true : undefined);
+    } catch {
+      // ignore
+    }
+    this._scheduleReconnect();
+  }
+
+  _scheduleReconnect() {
+    if (this._stopped || this._reconnectTimer) return;
+    this._reconnectTimer = setTimeout(() => {
+      this._reconnectTimer = null;
+      void this.start();
+    }, RECONNECT_MS);
+    this._reconnectTimer.unref?.();
+  }
+
+  /**
+   * Subscribe to "job pending" for `agentId` for at most `timeoutMs`.
+   * Subscribe *before* checking the queue so a job created in between isn't missed.
+   * `wait` resolves true when woken by a notification, false on timeout/re-check.
+   */
+  subscribe(agentId, timeoutMs) {
+    const key = String(agentId || '');
+    const budget = Math.max(0, Number(timeoutMs) || 0);
+    const ms = this._client ? budget : Math.min(budget, FALLBACK_RECHECK_MS);
+
+    let timer = null;
+    let onJob = null;
+    let settle = null;
+    const wait = new Promise((resolve) => {
+      settle = resolve;
+      onJob = () => {
+        clearTimeout(timer);
+        resolve(true);
+      };
+      timer = setTimeout(() => {
+        this._emitter.removeListener(key, onJob);
+        resolve(false);
+      }, ms);
+      this._emitter.once(key, onJob);
+    });
+
+    const cancel = () => {
+      clearTimeout(timer);
+      this._emitter.removeListener(key, onJob);
+      settle(false);
+    };
+
+    return { wait, cancel };
+  }
+}
+
+module.exports = new BrainJobNotifier();
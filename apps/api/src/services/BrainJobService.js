@@ -8,9 +8,11 @@ const config = require('../config');
 const { transaction } = require('../config/database');
 const { BadRequestError, NotFoundError } = require('../utils/errors');
 const { bestEffortInTransaction } = require('../utils/savepoint');
+const { isValidUUID } = require('../utils/validators');
 const ResearchLabService = require('./ResearchLabService');
 const MemoryRollupService = require('./MemoryRollupService');
 const PolicyService = require('./PolicyService');
+const BrainJobNotifier = require('./BrainJobNotifier');
 
 function clampNumber(v, min, max) {
   const n = typeof v === 'number' ? v : Number(v);
@@ -423,11 +425,83 @@ class BrainJobService {
     });
   }
 
+  /**
+   * Lease up to `limit` jobs for one agent in a single round trip.
+   * Same ordering/lease semantics as pullNextJob.
+   */
+  static async pullNextJobs(agentId, { limit = 1 } = {}) {
+    const maxBatch = Number(config.brain?.maxPullBatch) || 20;
+    const safeLimit = Math.max(1, Math.min(maxBatch, Math.trunc(Number(limit) || 1)));
+
+    return transaction(async (client) => {
+      const leaseSeconds = Number(config.brain?.leaseSeconds) || 60;
+      const { rows } = await client.query(
+        `WITH picked AS (
+           SELECT id
+           FROM brain_jobs
+           WHERE agent_id = $1
+             AND (
+               status = 'pending'
+               OR (status = 'leased' AND lease_expires_at < NOW())
+             )
+           ORDER BY created_at ASC
+           FOR UPDATE SKIP LOCKED
+           LIMIT $2
+         )
+         UPDATE brain_jobs j
+         SET status = 'leased',
+             lease_expires_at = NOW() + ($3::text || ' seconds')::interval,
+             leased_at = NOW(),
+             finished_at = NULL,
+             updated_at = NOW()
+         FROM picked
+         WHERE j.id = picked.id
+         RETURNING j.id, j.job_type, j.input, j.status, j.lease_expires_at, j.leased_at, j.finished_at, j.created_at`,
+        [agentId, safeLimit, String(leaseSeconds)]
+      );
+
+      return (rows || []).sort((a, b) => new Date(a.created_at) - new Date(b.created_at));
+    });
+  }
+
+  /**
+   * Long-poll wrapper around a pull function: returns as soon as `pull()` yields work,
+   * otherwise waits for a pending-job notification (or `waitMs`) and tries again.
+   * `isCancelled()` is checked before every pull so a disconnected client never leases a job.
+   */
+  static async pullWithWait(agentId, pull, { waitMs = 0, isCancelled = () => false } = {}) {
+    const maxWait = Number(config.brain?.maxLongPollMs) || 25000;
+    const budget = Math.max(0, Math.min(maxWait, Math.trunc(Number(waitMs) || 0)));
+    const deadline = Date.now() + budget;
+    const isEmpty = (v) => (Array.isArray(v) ? v.length === 0 : !v);
+
+    for (;;) {
+      const remaining = deadline - Date.now();
+      const sub = remaining > 0 ? BrainJobNotifier.subscribe(agentId, remaining) : null;
+      if (isCancelled()) {
+        sub?.cancel();
+        return null;
+      }
+      let found;
+      try {
+        found = await pull();
+      } catch (e) {
+        sub?.cancel();
+        throw e;
+      }
+      if (!isEmpty(found) || !sub) {
+        sub?.cancel();
+        return found;
+      }
+      await sub.wait;
+    }
+  }
+
   static async getJob(agentId, jobId) {
     return transaction(async (client) => {
       const { rows } = await client.query(
         `SELECT id, job_type, input, status, retry_count, retryable, last_error_code, last_error_at,
-                lease_expires_at, leased_at, finished_at, result, error, created_at, updated_at
+                lease_expires_at, leased_at, finished_at, result, partial, partial_at, error, created_at, updated_at
          FROM brain_jobs
          WHERE id = $1 AND agent_id = $2`,
         [jobId, agentId]
@@ -446,7 +520,7 @@ class BrainJobService {
     return transaction(async (client) => {
       const { rows } = await client.query(
         `SELECT id, agent_id, job_type, status, retry_count, retryable, last_error_code, last_error_at,
-                error, created_at, updated_at, finished_at
+                error, partial, partial_at, created_at, updated_at, finished_at
          FROM brain_jobs
          WHERE agent_id = $1
            AND ($2::text IS NULL OR status = $2::text)
@@ -553,6 +627,68 @@ class BrainJobService {
     });
   }
 
+  /**
+   * Store an in-progress result for a leased job (streaming DIALOGUE lines).
+   * Best-effort: ignored once the job is no longer leased, so a late partial never
+   * overwrites a finished job. The final submit still goes through submitJob validation.
+   */
+  static async submitPartial(agentId, jobId, partial) {
+    if (!partial || typeof partial !== 'object' || Array.isArray(partial)) {
+      throw new BadRequestError('partial must be an object');
+    }
+    const partialJson = JSON.stringify(partial);
+    if (partialJson.length > 16000) {
+      throw new BadRequestError('partial is too large');
+    }
+
+    return transaction(async (client) => {
+      const { rows } = await client.query(
+        `UPDATE brain_jobs
+         SET partial = $3::jsonb,
+             partial_at = NOW(),
+             updated_at = NOW()
+         WHERE id = $1 AND agent_id = $2 AND status = 'leased'
+         RETURNING id, job_type, status, partial_at`,
+        [jobId, agentId, partialJson]
+      );
+      return rows[0] || null;
+    });
+  }
+
+  /**
+   * Submit many results at once. Each job is committed in its own transaction so one
+   * bad result never rolls back the others; failures are reported per job.
+   */
+  static async submitJobs(agentId, items) {
+    const maxBatch = Number(config.brain?.maxSubmitBatch) || 50;
+    if (!Array.isArray(items) || items.length === 0) {
+      throw new BadRequestError('results must be a non-empty array');
+    }
+    if (items.length > maxBatch) {
+      throw new BadRequestError(`results must contain at most ${maxBatch} items`);
+    }
+
+    const out = [];
+    for (const item of items) {
+      const jobId = String(item?.id ?? '').trim();
+      if (!isValidUUID(jobId)) {
+        out.push({ id: jobId, ok: false, error: 'Invalid ID format', code: 'INVALID_ID' });
+        continue;
+      }
+      try {
+        const job = await BrainJobService.submitJob(agentId, jobId, {
+          status: String(item?.status ?? '').trim(),
+          result: item?.result,
+          error: item?.error
+        });
+        out.push({ id: jobId, ok: true, job });
+      } catch (e) {
+        out.push({ id: jobId, ok: false, error: String(e?.message || e), code: e?.code || null });
+      }
+    }
+    return out;
+  }
+
   static async _applyJobResult(client, job, result) {
     if (!result || typeof result !== 'object') return;
 
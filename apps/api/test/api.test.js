@@ -25,6 +25,7 @@ const { signUser, verifyUserToken } = require('../src/utils/jwt');
 const { requireUserAuth } = require('../src/middleware/userAuth');
 const UserService = require('../src/services/UserService');
 const BrainJobService = require('../src/services/BrainJobService');
+const BrainJobNotifier = require('../src/services/BrainJobNotifier');
 const ArenaService = require('../src/services/ArenaService');
 
 // Test framework
@@ -316,6 +317,46 @@ describe('BrainJobService', () => {
     );
     assertEqual(cited, false);
   });
+
+  test('submitJobs rejects an empty batch', async () => {
+    let threw = false;
+    try {
+      await BrainJobService.submitJobs('agent-1', []);
+    } catch (error) {
+      threw = error instanceof BadRequestError;
+    }
+    assert(threw, 'Should throw BadRequestError');
+  });
+
+  test('submitJobs reports invalid ids per job without failing the batch', async () => {
+    const results = await BrainJobService.submitJobs('agent-1', [
+      { id: 'not-a-uuid', status: 'done', result: {} },
+      { id: '', status: 'failed', error: 'x' }
+    ]);
+    assertEqual(results.length, 2);
+    assertEqual(results[0].ok, false);
+    assertEqual(results[0].code, 'INVALID_ID');
+    assertEqual(results[1].ok, false);
+  });
+
+  test('submitPartial rejects non-object payloads', async () => {
+    let threw = false;
+    try {
+      await BrainJobService.submitPartial('agent-1', 'job-1', ['line']);
+    } catch (error) {
+      threw = error instanceof BadRequestError;
+    }
+    assert(threw, 'Should throw BadRequestError');
+  });
+
+  test('BrainJobNotifier wakes a subscriber for its agent only', async () => {
+    const mine = BrainJobNotifier.subscribe('agent-a', 1000);
+    const other = BrainJobNotifier.subscribe('agent-b', 1000);
+    BrainJobNotifier._emitter.emit('agent-a');
+    assertEqual(await mine.wait, true);
+    other.cancel();
+    assertEqual(await other.wait, false);
+  });
 });
 
 describe('ArenaService', () => {
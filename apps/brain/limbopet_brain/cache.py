@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable
+
+from limbopet_brain.generators.base import AsyncGenerator
+from limbopet_brain.generators.prompts import JOB_SPECS, spec_fingerprint
+
+# Job types whose outputs are safe to reuse for byte-identical inputs.
+DEFAULT_CACHE_JOB_TYPES = frozenset({"DIALOGUE", "DAILY_SUMMARY", "PLAZA_POST"})
+
+
+def normalize_input(job_input: dict[str, Any] | None) -> str:
+    return json.dumps(job_input or {}, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+
+
+def cache_key(job_type: str, model: str, job_input: dict[str, Any] | None) -> str:
+    parts = [job_type, model, spec_fingerprint(job_type), normalize_input(job_input)]
+    return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+
+@dataclass
+class ResultCache:
+    """Content-addressed SQLite store for generator results, with TTL and LRU eviction."""
+
+    path: str
+    ttl_s: float = 7 * 24 * 3600.0
+    max_entries: int = 50_000
+    job_types: frozenset[str] = DEFAULT_CACHE_JOB_TYPES
+    _conn: sqlite3.Connection = field(init=False, repr=False)
+    _lock: threading.Lock = field(init=False, repr=False, default_factory=threading.Lock)
+    _hits: dict[str, int] = field(init=False, default_factory=dict)
+    _misses: dict[str, int] = field(init=False, default_factory=dict)
+
+    def __post_init__(self) -> None:
+        Path(self.path).expanduser().parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(Path(self.path).expanduser()), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS results (
+                key TEXT PRIMARY KEY,
+                job_type TEXT NOT NULL,
+                result TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_used_at REAL NOT NULL
+            )"""
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_results_last_used ON results(last_used_at)")
+
+    def enabled_for(self, job_type: str) -> bool:
+        return job_type in self.job_types and job_type in JOB_SPECS
+
+    def get(self, key: str, job_type: str) -> dict[str, Any] | None:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT result, created_at FROM results WHERE key = ?", (key,)).fetchone()
+            if row is not None and now - float(row[1]) > self.ttl_s:
+                self._conn.execute("DELETE FROM results WHERE key = ?", (key,))
+                row = None
+            if row is None:
+                self._misses[job_type] = self._misses.get(job_type, 0) + 1
+                return None
+            self._conn.execute("UPDATE results SET last_used_at = ? WHERE key = ?", (now, key))
+            self._hits[job_type] = self._hits.get(job_type, 0) + 1
+        return json.loads(row[0])
+
+    def put(self, key: str, job_type: str, result: dict[str, Any]) -> None:
+        now = time.time()
+        payload = json.dumps(result, ensure_ascii=False)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO results (key, job_type, result, created_at, last_used_at) VALUES (?, ?, ?, ?, ?)",
+                (key, job_type, payload, now, now),
+            )
+            self._evict(now)
+
+    def _evict(self, now: float) -> None:
+        self._conn.execute("DELETE FROM results WHERE created_at < ?", (now - self.ttl_s,))
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM results").fetchone()
+        overflow = int(count) - int(self.max_entries)
+        if overflow > 0:
+            self._conn.execute(
+                "DELETE FROM results WHERE key IN (SELECT key FROM results ORDER BY last_used_at ASC LIMIT ?)",
+                (overflow,),
+            )
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        with self._lock:
+            types = sorted(set(self._hits) | set(self._misses))
+            return {t: {"hits": self._hits.get(t, 0), "misses": self._misses.get(t, 0)} for t in types}
+
+    def format_stats(self) -> str:
+        stats = self.stats()
+        hits = sum(s["hits"] for s in stats.values())
+        total = hits + sum(s["misses"] for s in stats.values())
+        per_type = ", ".join(f"{t} {s['hits']}/{s['hits'] + s['misses']}" for t, s in stats.items())
+        rate = (hits / total * 100.0) if total else 0.0
+        return f"🗃️ cache hits {hits}/{total} ({rate:.0f}%)" + (f" [{per_type}]" if per_type else "")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+@dataclass(frozen=True)
+class CachingGenerator:
+    """Wraps a generator; identical (job_type, model, input, prompt version) jobs are served from the cache."""
+
+    inner: AsyncGenerator
+    cache: ResultCache
+    model: str
+
+    def generate(self, job_type: str, job_input: dict[str, Any]) -> dict[str, Any]:
+        if not self.cache.enabled_for(job_type):
+            return self.inner.generate(job_type, job_input)
+
+        key = cache_key(job_type, self.model, job_input)
+        cached = self.cache.get(key, job_type)
+        if cached is not None:
+            return cached
+
+        result = self.inner.generate(job_type, job_input)
+        self.cache.put(key, job_type, result)
+        return result
+
+    def stream_generate(self, job_type: str, job_input: dict[str, Any], on_lines: Callable[[list[str]], None]) -> dict[str, Any]:
+        stream = getattr(self.inner, "stream_generate", None)
+        if not self.cache.enabled_for(job_type):
+            return stream(job_type, job_input, on_lines) if callable(stream) else self.inner.generate(job_type, job_input)
+
+        key = cache_key(job_type, self.model, job_input)
+        cached = self.cache.get(key, job_type)
+        if cached is not None:
+            return cached
+
+        result = stream(job_type, job_input, on_lines) if callable(stream) else self.inner.generate(job_type, job_input)
+        self.cache.put(key, job_type, result)
+        return result
+
+    async def agenerate(self, job_type: str, job_input: dict[str, Any]) -> dict[str, Any]:
+        if not self.cache.enabled_for(job_type):
+            return await self.inner.agenerate(job_type, job_input)
+
+        key = cache_key(job_type, self.model, job_input)
+        cached = self.cache.get(key, job_type)
+        if cached is not None:
+            return cached
+
+        result = await self.inner.agenerate(job_type, job_input)
+        self.cache.put(key, job_type, result)
+        return result
+
+    def close(self) -> None:
+        close = getattr(self.inner, "close", None)
+        if callable(close):
+            close()
+
+    async def aclose(self) -> None:
+        aclose = getattr(self.inner, "aclose", None)
+        if callable(aclose):
+            await aclose()
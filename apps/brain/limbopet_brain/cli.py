@@ -5,6 +5,7 @@ import os
 
 from dotenv import load_dotenv
 
+from limbopet_brain.cache import DEFAULT_CACHE_JOB_TYPES, ResultCache
 from limbopet_brain.client import LimbopetClient, from_env
 from limbopet_brain.onboard import run_onboard
 from limbopet_brain.runner import build_runner
@@ -19,7 +20,38 @@ def _add_run(sub: argparse._SubParsersAction) -> None:
     # Legacy flag (kept for compatibility)
     p.add_argument("--openai-model", default=None)
     p.add_argument("--poll-interval", type=float, default=1.0)
+    p.add_argument(
+        "--long-poll",
+        type=float,
+        default=0.0,
+        help="Seconds the server may hold an empty pull open, e.g. 20 (0 = fixed-interval polling every --poll-interval)",
+    )
+    p.add_argument(
+        "--cache",
+        default=os.environ.get("LIMBOPET_CACHE_PATH", ""),
+        help="SQLite file for the result cache (opt-in; identical job inputs reuse earlier results)",
+    )
+    p.add_argument("--cache-ttl", type=float, default=7 * 24 * 3600.0, help="Cache entry lifetime in seconds")
+    p.add_argument("--cache-max-entries", type=int, default=50_000, help="LRU bound for the result cache")
+    p.add_argument(
+        "--cache-job-types",
+        default=",".join(sorted(DEFAULT_CACHE_JOB_TYPES)),
+        help="Comma-separated job types to cache",
+    )
+    p.add_argument(
+        "--stream",
+        action="store_true",
+        default=os.environ.get("LIMBOPET_STREAM", "").strip() in {"1", "true", "on"},
+        help="Stream DIALOGUE generation and push each line to the API as soon as it is complete",
+    )
     p.add_argument("--once", action="store_true", help="Process at most one job and exit")
+    p.add_argument("--concurrency", type=int, default=1, help="Number of jobs kept in flight (worker pool size)")
+    p.add_argument(
+        "--batch-size",
+        type=int,
+        default=1,
+        help="Lease up to N jobs per pull and submit results in one call (falls back to 1 if the server can't batch)",
+    )
 
 def _add_onboard(sub: argparse._SubParsersAction) -> None:
     p = sub.add_parser("onboard", help="Beginner onboarding: create user+pet and write .env")
@@ -43,15 +75,36 @@ def main(argv: list[str] | None = None) -> int:
     args = parser.parse_args(argv)
 
     if args.cmd == "run":
-        client: LimbopetClient = from_env()
+        concurrency = max(1, int(args.concurrency))
+        client: LimbopetClient = from_env(max_connections=max(16, concurrency))
         model = str(args.model or args.openai_model or "")
-        runner = build_runner(
-            client,
-            mode=args.mode,
-            model=model,
-            poll_interval_s=float(args.poll_interval),
-        )
-        return runner.run(once=bool(args.once))
+        cache = None
+        if args.cache:
+            cache = ResultCache(
+                path=str(args.cache),
+                ttl_s=float(args.cache_ttl),
+                max_entries=int(args.cache_max_entries),
+                job_types=frozenset(t.strip().upper() for t in str(args.cache_job_types).split(",") if t.strip()),
+            )
+        with client:
+            runner = build_runner(
+                client,
+                mode=args.mode,
+                model=model,
+                poll_interval_s=float(args.poll_interval),
+                concurrency=concurrency,
+                batch_size=int(args.batch_size),
+                long_poll_s=float(args.long_poll),
+                cache=cache,
+                stream=bool(args.stream),
+            )
+            try:
+                return runner.run(once=bool(args.once))
+            finally:
+                runner.close()
+                if cache is not None:
+                    print(cache.format_stats())
+                    cache.close()
 
     if args.cmd == "onboard":
         result = run_onboard(
@@ -1,5 +1,5 @@
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
 import httpx
@@ -10,23 +10,59 @@ class LimbopetClient:
     api_url: str
     api_key: str
     timeout_s: float = 30.0
+    # Upper bound for concurrent keep-alive connections to the API (one per in-flight worker is enough).
+    max_connections: int = 16
+    _http: httpx.Client = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        limits = httpx.Limits(max_connections=self.max_connections, max_keepalive_connections=self.max_connections)
+        object.__setattr__(self, "_http", httpx.Client(timeout=self.timeout_s, limits=limits))
+
+    def __enter__(self) -> "LimbopetClient":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._http.close()
 
     def _headers(self) -> dict[str, str]:
         return {"Authorization": f"Bearer {self.api_key}"}
 
-    def pull_job(self) -> dict[str, Any] | None:
-        with httpx.Client(timeout=self.timeout_s) as client:
-            r = client.post(f"{self.api_url}/brains/jobs/pull", headers=self._headers())
-            r.raise_for_status()
-            data = r.json()
-            return data.get("job")
+    def _pull_kwargs(self, wait_s: float, body: dict[str, Any]) -> dict[str, Any]:
+        if wait_s <= 0:
+            return {"json": body} if body else {}
+        # The server holds the request up to wait_s; give the read timeout that much headroom.
+        return {"json": {**body, "wait_ms": int(wait_s * 1000)}, "timeout": self.timeout_s + wait_s}
+
+    def pull_job(self, *, wait_s: float = 0.0) -> dict[str, Any] | None:
+        r = self._http.post(f"{self.api_url}/brains/jobs/pull", headers=self._headers(), **self._pull_kwargs(wait_s, {}))
+        r.raise_for_status()
+        data = r.json()
+        return data.get("job")
+
+    def capabilities(self) -> dict[str, Any]:
+        """Optional protocol features advertised by the server ({} when the server predates discovery)."""
+        r = self._http.get(f"{self.api_url}/brains/capabilities", headers=self._headers())
+        if r.status_code == 404:
+            return {}
+        r.raise_for_status()
+        data = r.json()
+        return data.get("capabilities") or {}
+
+    def pull_jobs(self, limit: int, *, wait_s: float = 0.0) -> list[dict[str, Any]]:
+        kwargs = self._pull_kwargs(wait_s, {"limit": int(limit)})
+        r = self._http.post(f"{self.api_url}/brains/jobs/pull-batch", headers=self._headers(), **kwargs)
+        r.raise_for_status()
+        data = r.json()
+        return list(data.get("jobs") or [])
 
     def get_job(self, job_id: str) -> dict[str, Any] | None:
-        with httpx.Client(timeout=self.timeout_s) as client:
-            r = client.get(f"{self.api_url}/brains/jobs/{job_id}", headers=self._headers())
-            r.raise_for_status()
-            data = r.json()
-            return data.get("job")
+        r = self._http.get(f"{self.api_url}/brains/jobs/{job_id}", headers=self._headers())
+        r.raise_for_status()
+        data = r.json()
+        return data.get("job")
 
     def submit_job(self, job_id: str, *, status: str, result: dict[str, Any] | None = None, error: str | None = None) -> None:
         payload: dict[str, Any] = {"status": status}
@@ -35,15 +71,27 @@ class LimbopetClient:
         if error is not None:
             payload["error"] = error
 
-        with httpx.Client(timeout=self.timeout_s) as client:
-            r = client.post(f"{self.api_url}/brains/jobs/{job_id}/submit", headers=self._headers(), json=payload)
-            r.raise_for_status()
+        r = self._http.post(f"{self.api_url}/brains/jobs/{job_id}/submit", headers=self._headers(), json=payload)
+        r.raise_for_status()
+
+    def submit_partial(self, job_id: str, partial: dict[str, Any]) -> bool:
+        """Push an in-progress result (e.g. DIALOGUE lines so far); False if the job is no longer leased."""
+        r = self._http.post(f"{self.api_url}/brains/jobs/{job_id}/partial", headers=self._headers(), json={"partial": partial})
+        r.raise_for_status()
+        data = r.json()
+        return bool(data.get("accepted"))
 
+    def submit_jobs(self, results: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Submit many results in one call; returns per-job acks ({id, ok, error?})."""
+        r = self._http.post(f"{self.api_url}/brains/jobs/submit-batch", headers=self._headers(), json={"results": results})
+        r.raise_for_status()
+        data = r.json()
+        return list(data.get("results") or [])
 
-def from_env() -> LimbopetClient:
+
+def from_env(*, max_connections: int = 16) -> LimbopetClient:
     api_url = os.environ.get("LIMBOPET_API_URL", "http://localhost:3001/api/v1").rstrip("/")
     api_key = os.environ.get("LIMBOPET_API_KEY", "").strip()
     if not api_key:
         raise RuntimeError("LIMBOPET_API_KEY is required")
-    return LimbopetClient(api_url=api_url, api_key=api_key)
-
+    return LimbopetClient(api_url=api_url, api_key=api_key, max_connections=max_connections)
@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+from typing import Any, Protocol, runtime_checkable
+
+
+class Generator(Protocol):
+    def generate(self, job_type: str, job_input: dict[str, Any]) -> dict[str, Any]: ...
+
+
+@runtime_checkable
+class AsyncGenerator(Generator, Protocol):
+    """Async counterpart of Generator; all built-in generators implement both and share their pooled clients."""
+
+    async def agenerate(self, job_type: str, job_input: dict[str, Any]) -> dict[str, Any]: ...
@@ -1,26 +1,52 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import os
-from dataclasses import dataclass
-from typing import Any
+from dataclasses import dataclass, field
+from typing import Any, Iterator
+from weakref import WeakKeyDictionary
 
 import httpx
 
 from limbopet_brain.json_utils import parse_json_loose
 from limbopet_brain.generators.prompts import get_job_spec, validate_output
+from limbopet_brain.generators.streaming import OnLines, iter_sse_json, stream_text
+from limbopet_brain.generators.transport import HttpSettings, apost_with_retry, post_with_retry
 
 
 @dataclass(frozen=True)
 class GoogleGenerator:
     model: str
     max_output_tokens: int = 800
+    http: HttpSettings = field(default_factory=HttpSettings.from_env)
+    _http: httpx.Client = field(init=False, repr=False, compare=False)
+    # One async client per event loop: an AsyncClient must only be used on the loop it was created on.
+    _ahttp: WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = field(
+        init=False, repr=False, compare=False, default_factory=WeakKeyDictionary
+    )
 
     def __post_init__(self) -> None:
         if not os.environ.get("GOOGLE_API_KEY"):
             raise RuntimeError("GOOGLE_API_KEY is required for --mode google")
+        # Long-lived pooled client so keep-alive connections are reused across jobs (and worker threads).
+        object.__setattr__(self, "_http", self.http.client())
 
-    def _call(self, *, prompt: str, temperature: float) -> str:
+    def _async_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        if loop not in self._ahttp:
+            self._ahttp[loop] = self.http.async_client()
+        return self._ahttp[loop]
+
+    def close(self) -> None:
+        self._http.close()
+
+    async def aclose(self) -> None:
+        client = self._ahttp.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+    def _request(self, *, prompt: str, temperature: float) -> tuple[str, dict[str, Any]]:
         api_key = os.environ["GOOGLE_API_KEY"].strip()
         base_url = os.environ.get("GOOGLE_BASE_URL", "https://generativelanguage.googleapis.com").rstrip("/")
         url = f"{base_url}/v1beta/models/{self.model}:generateContent"
@@ -32,13 +58,11 @@ class GoogleGenerator:
                 "maxOutputTokens": int(self.max_output_tokens),
             },
         }
+        return url, {"params": {"key": api_key}, "json": payload}
 
-        with httpx.Client(timeout=60.0) as client:
-            r = client.post(url, params={"key": api_key}, json=payload)
-            r.raise_for_status()
-            data = r.json()
-
-        candidates = data.get("candidates")
+    @staticmethod
+    def _parse(data: Any) -> str:
+        candidates = data.get("candidates") if isinstance(data, dict) else None
         if not isinstance(candidates, list) or not candidates:
             raise ValueError("Google response missing candidates")
         content = candidates[0].get("content") if isinstance(candidates[0], dict) else None
@@ -50,11 +74,54 @@ class GoogleGenerator:
             raise ValueError("Google response did not include text")
         return text
 
-    def generate(self, job_type: str, job_input: dict[str, Any]) -> dict[str, Any]:
-        system, temperature, required_keys = get_job_spec(job_type)
+    def _call(self, *, prompt: str, temperature: float) -> str:
+        url, kwargs = self._request(prompt=prompt, temperature=temperature)
+        r = post_with_retry(self._http, self.http, url, **kwargs)
+        return self._parse(r.json())
 
+    async def _acall(self, *, prompt: str, temperature: float) -> str:
+        url, kwargs = self._request(prompt=prompt, temperature=temperature)
+        r = await apost_with_retry(self._async_client(), self.http, url, **kwargs)
+        return self._parse(r.json())
+
+    def _stream(self, *, prompt: str, temperature: float) -> Iterator[str]:
+        url, kwargs = self._request(prompt=prompt, temperature=temperature)
+        url = url.replace(":generateContent", ":streamGenerateContent")
+        kwargs["params"] = {**kwargs["params"], "alt": "sse"}
+        with self._http.stream("POST", url, **kwargs) as r:
+            r.raise_for_status()
+            for event in iter_sse_json(r.iter_lines()):
+                try:
+                    text = self._parse(event)
+                except ValueError:
+                    continue  # e.g. the final event carrying only finishReason / usage
+                if text:
+                    yield text
+
+    @staticmethod
+    def _prompt(job_type: str, job_input: dict[str, Any]) -> tuple[str, float, list[str]]:
+        system, temperature, required_keys = get_job_spec(job_type)
         payload = {"job_type": job_type, **(job_input or {})} if job_type == "DIALOGUE" else (job_input or {})
-        prompt = system + "\n\n" + json.dumps(payload, ensure_ascii=False)
+        return system + "\n\n" + json.dumps(payload, ensure_ascii=False), temperature, required_keys
+
+    def generate(self, job_type: str, job_input: dict[str, Any]) -> dict[str, Any]:
+        prompt, temperature, required_keys = self._prompt(job_type, job_input)
         text = self._call(prompt=prompt, temperature=temperature)
         data = parse_json_loose(text)
         return validate_output(data, required_keys)
+
+    async def agenerate(self, job_type: str, job_input: dict[str, Any]) -> dict[str, Any]:
+        prompt, temperature, required_keys = self._prompt(job_type, job_input)
+        text = await self._acall(prompt=prompt, temperature=temperature)
+        data = parse_json_loose(text)
+        return validate_output(data, required_keys)
+
+    def stream_generate(self, job_type: str, job_input: dict[str, Any], on_lines: OnLines) -> dict[str, Any]:
+        prompt, temperature, required_keys = self._prompt(job_type, job_input)
+        text = stream_text(
+            lambda: self._stream(prompt=prompt, temperature=temperature),
+            lambda: self._call(prompt=prompt, temperature=temperature),
+            on_lines,
+        )
+        data = parse_json_loose(text)
+        return validate_output(data, required_keys)
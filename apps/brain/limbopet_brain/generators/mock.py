@@ -212,3 +212,6 @@ class MockGenerator:
             return {"changes": changes, "reasoning": "무리하지 않고 조금만 조정.", "safe_level": 1}
 
         raise ValueError(f"Unsupported job_type: {job_type}")
+
+    async def agenerate(self, job_type: str, job_input: dict[str, Any]) -> dict[str, Any]:
+        return self.generate(job_type, job_input)
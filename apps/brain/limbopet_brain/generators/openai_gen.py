@@ -1,14 +1,18 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import os
-from dataclasses import dataclass
-from typing import Any
+from dataclasses import dataclass, field
+from typing import Any, Iterator
+from weakref import WeakKeyDictionary
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
 from limbopet_brain.json_utils import parse_json_loose
 from limbopet_brain.generators.prompts import get_job_spec, validate_output
+from limbopet_brain.generators.streaming import OnLines, stream_text
+from limbopet_brain.generators.transport import HttpSettings
 
 
 @dataclass(frozen=True)
@@ -16,28 +20,92 @@ class OpenAICompatibleGenerator:
     model: str
     api_key_env: str = "OPENAI_API_KEY"
     base_url: str | None = None
+    http: HttpSettings = field(default_factory=HttpSettings.from_env)
+    _openai: OpenAI = field(init=False, repr=False, compare=False)
+    # One async client per event loop: an AsyncClient must only be used on the loop it was created on.
+    _aopenai: WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncOpenAI] = field(
+        init=False, repr=False, compare=False, default_factory=WeakKeyDictionary
+    )
 
     def __post_init__(self) -> None:
         api_key = os.environ.get(self.api_key_env, "").strip()
         if not api_key:
             raise RuntimeError(f"{self.api_key_env} is required for OpenAI-compatible mode")
+        # One client per generator: pooled keep-alive connections, thread-safe. The SDK retries 429/5xx itself.
+        object.__setattr__(
+            self,
+            "_openai",
+            OpenAI(
+                api_key=api_key,
+                base_url=self.base_url,
+                max_retries=self.http.max_retries,
+                timeout=self.http.timeout(),
+                http_client=self.http.client(),
+            ),
+        )
 
     def _client(self) -> OpenAI:
-        api_key = os.environ.get(self.api_key_env, "").strip()
-        return OpenAI(api_key=api_key, base_url=self.base_url)
+        return self._openai
 
-    def generate(self, job_type: str, job_input: dict[str, Any]) -> dict[str, Any]:
-        system, temperature, required_keys = get_job_spec(job_type)
-        client = self._client()
+    def _async_client(self) -> AsyncOpenAI:
+        loop = asyncio.get_running_loop()
+        if loop not in self._aopenai:
+            self._aopenai[loop] = AsyncOpenAI(
+                api_key=os.environ.get(self.api_key_env, "").strip(),
+                base_url=self.base_url,
+                max_retries=self.http.max_retries,
+                timeout=self.http.timeout(),
+                http_client=self.http.async_client(),
+            )
+        return self._aopenai[loop]
 
+    def close(self) -> None:
+        self._openai.close()
+
+    async def aclose(self) -> None:
+        client = self._aopenai.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.close()
+
+    def _messages(self, job_type: str, job_input: dict[str, Any]) -> tuple[list[dict[str, str]], float, list[str]]:
+        system, temperature, required_keys = get_job_spec(job_type)
         payload = {"job_type": job_type, **(job_input or {})} if job_type == "DIALOGUE" else (job_input or {})
         user = json.dumps(payload, ensure_ascii=False)
+        return [{"role": "system", "content": system}, {"role": "user", "content": user}], temperature, required_keys
+
+    def _complete(self, messages: list[dict[str, str]], temperature: float) -> str:
+        msg = self._client().chat.completions.create(model=self.model, messages=messages, temperature=temperature)
+        return msg.choices[0].message.content or "{}"
 
-        msg = client.chat.completions.create(
-            model=self.model,
-            messages=[{"role": "system", "content": system}, {"role": "user", "content": user}],
-            temperature=temperature,
+    def _stream(self, messages: list[dict[str, str]], temperature: float) -> Iterator[str]:
+        stream = self._client().chat.completions.create(
+            model=self.model, messages=messages, temperature=temperature, stream=True
         )
+        with stream:
+            for chunk in stream:
+                text = chunk.choices[0].delta.content if chunk.choices else None
+                if text:
+                    yield text
+
+    def generate(self, job_type: str, job_input: dict[str, Any]) -> dict[str, Any]:
+        messages, temperature, required_keys = self._messages(job_type, job_input)
+        raw = self._complete(messages, temperature)
+        data = parse_json_loose(raw)
+        return validate_output(data, required_keys)
+
+    async def agenerate(self, job_type: str, job_input: dict[str, Any]) -> dict[str, Any]:
+        messages, temperature, required_keys = self._messages(job_type, job_input)
+        msg = await self._async_client().chat.completions.create(model=self.model, messages=messages, temperature=temperature)
         raw = msg.choices[0].message.content or "{}"
         data = parse_json_loose(raw)
         return validate_output(data, required_keys)
+
+    def stream_generate(self, job_type: str, job_input: dict[str, Any], on_lines: OnLines) -> dict[str, Any]:
+        messages, temperature, required_keys = self._messages(job_type, job_input)
+        raw = stream_text(
+            lambda: self._stream(messages, temperature),
+            lambda: self._complete(messages, temperature),
+            on_lines,
+        )
+        data = parse_json_loose(raw or "{}")
+        return validate_output(data, required_keys)
@@ -1,8 +1,14 @@
 """Shared prompt templates and validation for all LLM generators."""
 from __future__ import annotations
 
+import hashlib
+import json
 from typing import Any
 
+# Bump when prompt semantics change in a way the spec text alone doesn't capture
+# (e.g. payload shaping in the generators). Part of the result-cache key.
+PROMPT_VERSION = "1"
+
 
 def _must(obj: Any, key: str) -> Any:
     if not isinstance(obj, dict) or key not in obj:
@@ -113,6 +119,13 @@ def get_job_spec(job_type: str) -> tuple[str, float, list[str]]:
     return JOB_SPECS[job_type]
 
 
+def spec_fingerprint(job_type: str) -> str:
+    """Stable short hash of PROMPT_VERSION + the job spec, so edited prompts never reuse cached results."""
+    system, temperature, required_keys = get_job_spec(job_type)
+    raw = json.dumps([PROMPT_VERSION, system, temperature, required_keys], ensure_ascii=False)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
+
+
 def validate_output(data: Any, required_keys: list[str]) -> dict[str, Any]:
     """Validate that all required keys are present in the output."""
     for key in required_keys:
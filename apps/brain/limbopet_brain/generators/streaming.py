@@ -0,0 +1,49 @@
+"""Helpers for streaming completions: SSE decoding and incremental DIALOGUE line delivery."""
+from __future__ import annotations
+
+import json
+from typing import Any, Callable, Iterable, Iterator
+
+from limbopet_brain.json_utils import IncrementalLines
+
+# Job types whose output can be delivered line by line while the model is still generating.
+STREAM_JOB_TYPES = frozenset({"DIALOGUE"})
+
+# Called with every line completed so far, each time a new one finishes.
+OnLines = Callable[[list[str]], None]
+
+
+def iter_sse_json(lines: Iterable[str]) -> Iterator[dict[str, Any]]:
+    """Decode `data:` payloads of a server-sent event stream; skips keep-alives and `[DONE]`."""
+    for line in lines:
+        if not line.startswith("data:"):
+            continue
+        data = line[5:].strip()
+        if not data or data == "[DONE]":
+            continue
+        try:
+            event = json.loads(data)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(event, dict):
+            yield event
+
+
+def stream_text(stream: Callable[[], Iterable[str]], call: Callable[[], str], on_lines: OnLines) -> str:
+    """Collect a streamed completion, reporting `lines` as they complete.
+
+    If the stream fails before the first delta (e.g. the provider rejects streaming), fall back to the
+    regular retrying call; once text has been delivered a failure is raised as-is.
+    """
+    parser = IncrementalLines()
+    parts: list[str] = []
+    try:
+        for delta in stream():
+            parts.append(delta)
+            if parser.feed(delta):
+                on_lines(parser.lines)
+    except Exception:
+        if parts:
+            raise
+        return call()
+    return "".join(parts)
@@ -0,0 +1,132 @@
+"""Shared HTTP transport settings for LLM generators (pooling, timeouts, retries)."""
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import os
+import random
+import time
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+
+RETRY_STATUS = frozenset({408, 409, 429, 500, 502, 503, 504, 529})
+
+
+def _env_float(name: str, default: float) -> float:
+    raw = os.environ.get(name, "").strip()
+    try:
+        return float(raw) if raw else default
+    except ValueError:
+        return default
+
+
+def _env_int(name: str, default: int) -> int:
+    return int(_env_float(name, float(default)))
+
+
+def http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+@dataclass(frozen=True)
+class HttpSettings:
+    timeout_s: float = 60.0
+    connect_timeout_s: float = 10.0
+    max_connections: int = 16
+    max_keepalive_connections: int = 16
+    keepalive_expiry_s: float = 30.0
+    http2: bool = True
+    max_retries: int = 3
+    backoff_base_s: float = 0.5
+    backoff_max_s: float = 8.0
+
+    @classmethod
+    def from_env(cls) -> "HttpSettings":
+        d = cls()
+        return cls(
+            timeout_s=_env_float("LIMBOPET_LLM_TIMEOUT_S", d.timeout_s),
+            connect_timeout_s=_env_float("LIMBOPET_LLM_CONNECT_TIMEOUT_S", d.connect_timeout_s),
+            max_connections=_env_int("LIMBOPET_LLM_MAX_CONNECTIONS", d.max_connections),
+            max_keepalive_connections=_env_int("LIMBOPET_LLM_MAX_KEEPALIVE", d.max_keepalive_connections),
+            http2=os.environ.get("LIMBOPET_LLM_HTTP2", "1").strip() not in {"0", "false", "off"},
+            max_retries=_env_int("LIMBOPET_LLM_MAX_RETRIES", d.max_retries),
+            backoff_base_s=_env_float("LIMBOPET_LLM_BACKOFF_BASE_S", d.backoff_base_s),
+            backoff_max_s=_env_float("LIMBOPET_LLM_BACKOFF_MAX_S", d.backoff_max_s),
+        )
+
+    def timeout(self) -> httpx.Timeout:
+        return httpx.Timeout(self.timeout_s, connect=self.connect_timeout_s)
+
+    def _client_kwargs(self) -> dict[str, Any]:
+        return {
+            "timeout": self.timeout(),
+            "limits": httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=self.keepalive_expiry_s,
+            ),
+            # HTTP/2 needs the optional `h2` package (pip install 'httpx[http2]'); fall back to HTTP/1.1.
+            "http2": self.http2 and http2_available(),
+        }
+
+    def client(self) -> httpx.Client:
+        return httpx.Client(**self._client_kwargs())
+
+    def async_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(**self._client_kwargs())
+
+    def backoff_s(self, attempt: int, response: httpx.Response | None = None) -> float:
+        """Delay before retry `attempt` (0-based): Retry-After if the server sent one, else jittered exponential."""
+        if response is not None:
+            retry_after = response.headers.get("retry-after", "").strip()
+            try:
+                if retry_after:
+                    return min(self.backoff_max_s, max(0.0, float(retry_after)))
+            except ValueError:
+                pass
+        cap = min(self.backoff_max_s, self.backoff_base_s * (2**attempt))
+        return random.uniform(0, cap)  # noqa: S311 - jitter, not crypto
+
+
+def _should_retry(response: httpx.Response) -> bool:
+    return response.status_code in RETRY_STATUS
+
+
+def post_with_retry(client: httpx.Client, settings: HttpSettings, url: str, **kwargs: Any) -> httpx.Response:
+    """POST with retries on 429/5xx and transport errors; raises for the final non-2xx response."""
+    for attempt in range(settings.max_retries + 1):
+        last = attempt >= settings.max_retries
+        try:
+            r = client.post(url, **kwargs)
+        except httpx.TransportError:
+            if last:
+                raise
+            time.sleep(settings.backoff_s(attempt))
+            continue
+        if _should_retry(r) and not last:
+            time.sleep(settings.backoff_s(attempt, r))
+            continue
+        r.raise_for_status()
+        return r
+    raise RuntimeError("unreachable")
+
+
+async def apost_with_retry(client: httpx.AsyncClient, settings: HttpSettings, url: str, **kwargs: Any) -> httpx.Response:
+    """Async variant of post_with_retry."""
+    for attempt in range(settings.max_retries + 1):
+        last = attempt >= settings.max_retries
+        try:
+            r = await client.post(url, **kwargs)
+        except httpx.TransportError:
+            if last:
+                raise
+            await asyncio.sleep(settings.backoff_s(attempt))
+            continue
+        if _should_retry(r) and not last:
+            await asyncio.sleep(settings.backoff_s(attempt, r))
+            continue
+        r.raise_for_status()
+        return r
+    raise RuntimeError("unreachable")
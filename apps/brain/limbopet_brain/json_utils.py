@@ -24,3 +24,51 @@ def parse_json_loose(text: str) -> dict[str, Any]:
             raise ValueError("Expected JSON object")
         return parsed
 
+
+
+_LINES_START = re.compile(r'"lines"\s*:\s*\[')
+
+
+class IncrementalLines:
+    """Pulls completed strings out of a `"lines": [...]` array while the JSON text is still streaming in."""
+
+    def __init__(self) -> None:
+        self._buf = ""
+        self._lines: list[str] = []
+
+    @property
+    def lines(self) -> list[str]:
+        return list(self._lines)
+
+    def feed(self, chunk: str) -> list[str]:
+        """Append a chunk; returns the lines that became complete with it (usually none or one)."""
+        self._buf += chunk or ""
+        start = _LINES_START.search(self._buf)
+        if not start:
+            return []
+
+        found: list[str] = []
+        pos = start.end()
+        n = len(self._buf)
+        while pos < n:
+            ch = self._buf[pos]
+            if ch in " \t\r\n,":
+                pos += 1
+                continue
+            if ch != '"':
+                break  # "]" or a non-string element: the array is done as far as we care.
+            end = pos + 1
+            while end < n and self._buf[end] != '"':
+                end += 2 if self._buf[end] == "\\" else 1
+            if end >= n:
+                break  # string still open
+            try:
+                value = json.loads(self._buf[pos : end + 1])
+            except json.JSONDecodeError:
+                break
+            found.append(str(value))
+            pos = end + 1
+
+        new = found[len(self._lines) :]
+        self._lines.extend(new)
+        return new
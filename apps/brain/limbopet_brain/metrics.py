@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+# "job created -> job picked up" targets for long-poll mode (server timestamps, so no clock skew).
+PICKUP_TARGET_P50_MS = 100.0
+PICKUP_TARGET_P99_MS = 500.0
+
+
+def _parse_ts(value: Any) -> datetime | None:
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+def pickup_latency_ms(job: dict[str, Any]) -> float | None:
+    """leased_at - created_at for a pulled job, in milliseconds (None if the server didn't send both)."""
+    created = _parse_ts(job.get("created_at"))
+    leased = _parse_ts(job.get("leased_at"))
+    if created is None or leased is None:
+        return None
+    return max(0.0, (leased - created).total_seconds() * 1000.0)
+
+
+def _percentile(sorted_values: list[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    idx = min(len(sorted_values) - 1, max(0, int(round(q * (len(sorted_values) - 1)))))
+    return sorted_values[idx]
+
+
+@dataclass
+class LatencyStats:
+    """Thread-safe rolling window of latency samples (ms)."""
+
+    window: int = 1000
+    _samples: deque[float] = field(init=False, repr=False)
+    _lock: threading.Lock = field(init=False, repr=False, default_factory=threading.Lock)
+    _count: int = field(init=False, default=0)
+
+    def __post_init__(self) -> None:
+        self._samples = deque(maxlen=self.window)
+
+    def record(self, value_ms: float | None) -> int:
+        """Add a sample; returns the total number of samples recorded so far."""
+        with self._lock:
+            if value_ms is not None:
+                self._samples.append(float(value_ms))
+                self._count += 1
+            return self._count
+
+    def summary(self) -> dict[str, float]:
+        with self._lock:
+            values = sorted(self._samples)
+        return {"n": float(len(values)), "p50": _percentile(values, 0.50), "p99": _percentile(values, 0.99)}
+
+    def format(self, label: str) -> str:
+        s = self.summary()
+        ok = s["p50"] <= PICKUP_TARGET_P50_MS and s["p99"] <= PICKUP_TARGET_P99_MS
+        target = f"target p50≤{PICKUP_TARGET_P50_MS:.0f}ms p99≤{PICKUP_TARGET_P99_MS:.0f}ms {'✓' if ok else '✗'}"
+        return f"📈 {label} p50={s['p50']:.0f}ms p99={s['p99']:.0f}ms (n={s['n']:.0f}, {target})"
@@ -1,19 +1,30 @@
 from __future__ import annotations
 
 import os
-import time
-from dataclasses import dataclass
-from typing import Any, Protocol
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field, replace
+from typing import Any
 
+from limbopet_brain.cache import CachingGenerator, ResultCache
 from limbopet_brain.client import LimbopetClient
+from limbopet_brain.metrics import LatencyStats, pickup_latency_ms
 from limbopet_brain.generators.mock import MockGenerator
 from limbopet_brain.generators.anthropic_gen import AnthropicGenerator
+from limbopet_brain.generators.base import AsyncGenerator, Generator
 from limbopet_brain.generators.google_gen import GoogleGenerator
 from limbopet_brain.generators.openai_gen import OpenAICompatibleGenerator
+from limbopet_brain.generators.streaming import STREAM_JOB_TYPES
+from limbopet_brain.generators.transport import HttpSettings
 
 
-class Generator(Protocol):
-    def generate(self, job_type: str, job_input: dict[str, Any]) -> dict[str, Any]: ...
+@dataclass(frozen=True)
+class _Session:
+    """Protocol features agreed with the server for this run."""
+
+    batch: int = 1
+    wait_s: float = 0.0
+    stream: bool = False
 
 
 @dataclass(frozen=True)
@@ -21,16 +32,108 @@ class Runner:
     client: LimbopetClient
     generator: Generator
     poll_interval_s: float = 1.0
+    concurrency: int = 1
+    batch_size: int = 1
+    # Long-poll: ask the server to hold an empty pull up to this long (0 = fixed-interval polling).
+    long_poll_s: float = 0.0
+    report_every: int = 100
+    # Stream DIALOGUE generation and push lines to the API as they complete (if the server accepts partials).
+    stream: bool = False
+    pickup: LatencyStats = field(default_factory=LatencyStats, compare=False, repr=False)
 
     def run(self, *, once: bool = False) -> int:
+        stop = threading.Event()
+        if once:
+            return self._loop(stop, _Session(stream=self._negotiate().stream), once=True)
+
+        session = self._negotiate()
+        try:
+            return self._run_workers(stop, session)
+        finally:
+            if self.pickup.summary()["n"]:
+                print(self.pickup.format("pickup latency"))
+
+    def _run_workers(self, stop: threading.Event, session: _Session) -> int:
+        if self.concurrency <= 1:
+            return self._loop(stop, session)
+
+        # Worker pool: each worker runs the same pull -> generate -> submit loop, sharing the
+        # pooled API client and the generator, so up to `concurrency` jobs are in flight.
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="brain-worker") as pool:
+            futures = [pool.submit(self._loop, stop, session) for _ in range(self.concurrency)]
+            try:
+                return max(f.result() for f in futures)
+            except KeyboardInterrupt:
+                print("⏹️ stopping workers (finishing in-flight jobs)…")
+                stop.set()
+                wait(futures)
+                return 130
+
+    def close(self) -> None:
+        close = getattr(self.generator, "close", None)
+        if callable(close):
+            close()
+
+    def _negotiate(self) -> _Session:
+        """Pick the protocol features to use from what the server advertises; _Session() = legacy polling."""
+        if self.batch_size <= 1 and self.long_poll_s <= 0 and not self.stream:
+            return _Session()
+        try:
+            caps = self.client.capabilities()
+        except Exception as e:  # noqa: BLE001
+            print(f"⚠️ capabilities check failed: {e}, using single-job polling")
+            return _Session()
+        caps = caps if isinstance(caps, dict) else {}
+
+        batch = 1
+        if self.batch_size > 1:
+            batch_caps = caps.get("batch")
+            if isinstance(batch_caps, dict):
+                max_pull = int(batch_caps.get("max_pull") or 1)
+                max_submit = int(batch_caps.get("max_submit") or 1)
+                batch = max(1, min(self.batch_size, max_pull, max_submit))
+            else:
+                print("ℹ️ server does not advertise batching, using single-job endpoints")
+
+        wait_s = 0.0
+        if self.long_poll_s > 0:
+            lp_caps = caps.get("long_poll")
+            if isinstance(lp_caps, dict):
+                max_wait_s = float(lp_caps.get("max_wait_ms") or 0) / 1000.0
+                wait_s = max(0.0, min(self.long_poll_s, max_wait_s))
+            else:
+                print(f"ℹ️ server does not advertise long-poll, polling every {self.poll_interval_s:g}s")
+
+        stream = False
+        if self.stream:
+            partial_caps = caps.get("partial")
+            stream = isinstance(partial_caps, dict) and "DIALOGUE" in (partial_caps.get("job_types") or [])
+            if not stream:
+                print("ℹ️ server does not accept partial results, DIALOGUE lines are submitted when complete")
+        return _Session(batch=batch, wait_s=wait_s, stream=stream)
+
+    def _pull(self, batch: int, wait_s: float) -> list[dict[str, Any]]:
+        if batch > 1:
+            jobs = self.client.pull_jobs(batch, wait_s=wait_s)
+        else:
+            job = self.client.pull_job(wait_s=wait_s)
+            jobs = [job] if job else []
+        for job in jobs:
+            n = self.pickup.record(pickup_latency_ms(job))
+            if self.report_every > 0 and n and n % self.report_every == 0:
+                print(self.pickup.format("pickup latency"))
+        return jobs
+
+    def _loop(self, stop: threading.Event, session: _Session, *, once: bool = False) -> int:
+        batch, wait_s = session.batch, session.wait_s
         backoff = self.poll_interval_s
         max_backoff = 30.0
-        while True:
+        while not stop.is_set():
             try:
-                job = self.client.pull_job()
+                jobs = self._pull(batch, wait_s)
             except Exception as e:  # noqa: BLE001
                 print(f"⚠️ pull_job failed: {e}, retry in {backoff:.0f}s")
-                time.sleep(backoff)
+                stop.wait(backoff)
                 backoff = min(backoff * 2, max_backoff)
                 if once:
                     return 1
@@ -38,54 +141,151 @@ class Runner:
 
             backoff = self.poll_interval_s
 
-            if not job:
+            if not jobs:
                 if once:
                     return 0
-                time.sleep(self.poll_interval_s)
+                # A long-poll that came back empty already waited server-side; pull again right away.
+                if wait_s <= 0:
+                    stop.wait(self.poll_interval_s)
                 continue
 
-            job_id = str(job.get("id"))
-            job_type = str(job.get("job_type"))
-            job_input = job.get("input") or {}
+            if batch > 1:
+                self._process_batch(jobs, stream=session.stream)
+            else:
+                self._process(jobs[0], stream=session.stream)
 
+            if once:
+                return 0
+        return 0
+
+    def _generate(self, job_id: str, job_type: str, job_input: dict[str, Any], *, stream: bool) -> dict[str, Any]:
+        stream_generate = getattr(self.generator, "stream_generate", None)
+        if not (stream and job_type in STREAM_JOB_TYPES and callable(stream_generate)):
+            return self.generator.generate(job_type, job_input)
+        return stream_generate(job_type, job_input, lambda lines: self._push_partial(job_id, lines))
+
+    def _push_partial(self, job_id: str, lines: list[str]) -> None:
+        # Best effort: the final submit carries the full result, so a lost partial only costs latency.
+        try:
+            self.client.submit_partial(job_id, {"lines": lines})
+        except Exception as e:  # noqa: BLE001
+            print(f"⚠️ submit_partial failed for {job_id}: {e}")
+
+    def _process(self, job: dict[str, Any], *, stream: bool = False) -> None:
+        job_id = str(job.get("id"))
+        job_type = str(job.get("job_type"))
+        job_input = job.get("input") or {}
+
+        try:
+            result = self._generate(job_id, job_type, job_input, stream=stream)
+            self.client.submit_job(job_id, status="done", result=result)
+            print(f"✅ done {job_type} {job_id}")
+        except Exception as e:  # noqa: BLE001
+            print(f"❌ failed {job_type} {job_id}: {e}")
             try:
-                result = self.generator.generate(job_type, job_input)
-                self.client.submit_job(job_id, status="done", result=result)
-                print(f"✅ done {job_type} {job_id}")
-            except Exception as e:  # noqa: BLE001
-                print(f"❌ failed {job_type} {job_id}: {e}")
+                self.client.submit_job(job_id, status="failed", error=str(e))
+            except Exception as submit_err:  # noqa: BLE001
+                print(f"⚠️ submit_job(failed) also failed: {submit_err}")
+
+    def _process_batch(self, jobs: list[dict[str, Any]], *, stream: bool = False) -> None:
+        # Generate the leased jobs side by side and submit each group of results as soon as it is
+        # ready, so one slow generation doesn't hold back the finished ones (nor their leases).
+        with ThreadPoolExecutor(max_workers=len(jobs), thread_name_prefix="brain-batch") as pool:
+            pending = {pool.submit(self._batch_result, job, stream=stream) for job in jobs}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                self._flush([f.result() for f in done])
+
+    def _batch_result(self, job: dict[str, Any], *, stream: bool) -> dict[str, Any]:
+        job_id = str(job.get("id"))
+        job_type = str(job.get("job_type"))
+        job_input = job.get("input") or {}
+        try:
+            result = self._generate(job_id, job_type, job_input, stream=stream)
+        except Exception as e:  # noqa: BLE001
+            print(f"❌ failed {job_type} {job_id}: {e}")
+            return {"id": job_id, "job_type": job_type, "status": "failed", "error": str(e)}
+        return {"id": job_id, "job_type": job_type, "status": "done", "result": result}
+
+    def _flush(self, results: list[dict[str, Any]]) -> None:
+        payload = [{k: v for k, v in r.items() if k != "job_type"} for r in results]
+        try:
+            acks = self.client.submit_jobs(payload)
+        except Exception as e:  # noqa: BLE001
+            # Don't lose finished work: retry each result on the single-job endpoint.
+            print(f"⚠️ submit_jobs failed: {e}, submitting one by one")
+            for r in results:
                 try:
-                    self.client.submit_job(job_id, status="failed", error=str(e))
+                    self.client.submit_job(r["id"], status=r["status"], result=r.get("result"), error=r.get("error"))
+                    if r["status"] == "done":
+                        print(f"✅ done {r['job_type']} {r['id']}")
                 except Exception as submit_err:  # noqa: BLE001
-                    print(f"⚠️ submit_job(failed) also failed: {submit_err}")
+                    print(f"⚠️ submit_job({r['status']}) failed for {r['id']}: {submit_err}")
+            return
+
+        by_id = {str(a.get("id")): a for a in acks if isinstance(a, dict)}
+        for r in results:
+            ack = by_id.get(r["id"]) or {}
+            if not ack.get("ok"):
+                print(f"⚠️ submit {r['job_type']} {r['id']} rejected: {ack.get('error') or 'no ack'}")
+            elif r["status"] == "done":
+                print(f"✅ done {r['job_type']} {r['id']}")
 
-            if once:
-                return 0
 
+def build_runner(
+    client: LimbopetClient,
+    *,
+    mode: str,
+    model: str,
+    poll_interval_s: float,
+    concurrency: int = 1,
+    batch_size: int = 1,
+    long_poll_s: float = 0.0,
+    cache: ResultCache | None = None,
+    stream: bool = False,
+) -> Runner:
+    base_http = HttpSettings.from_env()
+    # Enough pooled connections per provider for every in-flight job (each worker generates a whole batch at once).
+    in_flight = max(1, int(concurrency)) * max(1, int(batch_size))
+    http = replace(
+        base_http,
+        max_connections=max(base_http.max_connections, in_flight),
+        max_keepalive_connections=max(base_http.max_keepalive_connections, in_flight),
+    )
 
-def build_runner(client: LimbopetClient, *, mode: str, model: str, poll_interval_s: float) -> Runner:
     if mode == "mock":
-        gen: Generator = MockGenerator()
+        gen: AsyncGenerator = MockGenerator()
     elif mode == "openai":
         resolved = model or os.environ.get("OPENAI_MODEL", "gpt-4o-mini")
         base_url = os.environ.get("OPENAI_BASE_URL") or None
-        gen = OpenAICompatibleGenerator(model=resolved, api_key_env="OPENAI_API_KEY", base_url=base_url)
+        gen = OpenAICompatibleGenerator(model=resolved, api_key_env="OPENAI_API_KEY", base_url=base_url, http=http)
     elif mode == "xai":
         resolved = model or os.environ.get("XAI_MODEL", "grok-2-latest")
         base_url = os.environ.get("XAI_BASE_URL", "https://api.x.ai/v1").rstrip("/")
-        gen = OpenAICompatibleGenerator(model=resolved, api_key_env="XAI_API_KEY", base_url=base_url)
+        gen = OpenAICompatibleGenerator(model=resolved, api_key_env="XAI_API_KEY", base_url=base_url, http=http)
     elif mode == "anthropic":
         resolved = model or os.environ.get("ANTHROPIC_MODEL", "claude-3-5-sonnet-latest")
-        gen = AnthropicGenerator(model=resolved)
+        gen = AnthropicGenerator(model=resolved, http=http)
     elif mode == "google":
         resolved = model or os.environ.get("GOOGLE_MODEL", "gemini-1.5-flash")
-        gen = GoogleGenerator(model=resolved)
+        gen = GoogleGenerator(model=resolved, http=http)
     elif mode == "proxy":
         # Route through CLIProxyAPI (OpenAI-compatible endpoint)
         resolved = model or os.environ.get("CLIPROXY_MODEL", "gemini-2.5-flash")
         proxy_url = os.environ.get("CLIPROXY_BASE_URL", "http://127.0.0.1:8317").rstrip("/") + "/v1"
-        gen = OpenAICompatibleGenerator(model=resolved, api_key_env="CLIPROXY_API_KEY", base_url=proxy_url)
+        gen = OpenAICompatibleGenerator(model=resolved, api_key_env="CLIPROXY_API_KEY", base_url=proxy_url, http=http)
     else:
         raise ValueError("mode must be one of: mock, openai, xai, anthropic, google, proxy")
 
-    return Runner(client=client, generator=gen, poll_interval_s=poll_interval_s)
+    if cache is not None:
+        gen = CachingGenerator(inner=gen, cache=cache, model=f"{mode}:{getattr(gen, 'model', '')}")
+
+    return Runner(
+        client=client,
+        generator=gen,
+        poll_interval_s=poll_interval_s,
+        concurrency=max(1, int(concurrency)),
+        batch_size=max(1, int(batch_size)),
+        long_poll_s=max(0.0, float(long_poll_s)),
+        stream=bool(stream),
+    )
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import asyncio
+
+from limbopet_brain.cache import CachingGenerator, ResultCache
+from limbopet_brain.generators.anthropic_gen import AnthropicGenerator
+from limbopet_brain.generators.base import AsyncGenerator
+from limbopet_brain.generators.google_gen import GoogleGenerator
+from limbopet_brain.generators.mock import MockGenerator
+from limbopet_brain.generators.openai_gen import OpenAICompatibleGenerator
+
+
+class TestAsyncClients:
+    def test_each_event_loop_gets_its_own_client(self, monkeypatch):
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test")
+        gen = AnthropicGenerator(model="test")
+
+        async def client_pair():
+            return gen._async_client(), gen._async_client()
+
+        first, again = asyncio.run(client_pair())
+        second, _ = asyncio.run(client_pair())
+
+        assert first is again
+        assert second is not first
+        gen.close()
+
+    def test_aclose_closes_the_current_loop_client(self, monkeypatch):
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test")
+        gen = AnthropicGenerator(model="test")
+
+        async def open_and_close():
+            client = gen._async_client()
+            await gen.aclose()
+            return client
+
+        assert asyncio.run(open_and_close()).is_closed
+        assert len(gen._ahttp) == 0
+        gen.close()
+
+
+class TestAsyncGeneratorProtocol:
+    def test_builtin_generators_implement_async_generator(self, monkeypatch, tmp_path):
+        for env in ("OPENAI_API_KEY", "ANTHROPIC_API_KEY", "GOOGLE_API_KEY"):
+            monkeypatch.setenv(env, "test")
+        gens = [
+            MockGenerator(),
+            OpenAICompatibleGenerator(model="test"),
+            AnthropicGenerator(model="test"),
+            GoogleGenerator(model="test"),
+        ]
+        cache = ResultCache(path=tmp_path / "cache.sqlite")
+        gens.append(CachingGenerator(inner=gens[0], cache=cache, model="mock:"))
+
+        for gen in gens:
+            assert isinstance(gen, AsyncGenerator), type(gen).__name__
+        for gen in gens[1:4]:
+            gen.close()
+        cache.close()
+
+    def test_caching_generator_serves_agenerate_from_the_cache(self, tmp_path):
+        cache = ResultCache(path=tmp_path / "cache.sqlite")
+        gen = CachingGenerator(inner=MockGenerator(), cache=cache, model="mock:")
+        job_input = {"pet": {"name": "Limbo"}}
+
+        first = asyncio.run(gen.agenerate("DAILY_SUMMARY", job_input))
+        again = asyncio.run(gen.agenerate("DAILY_SUMMARY", job_input))
+
+        assert again == first
+        assert cache.stats()["DAILY_SUMMARY"]["hits"] == 1
+        cache.close()
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+from limbopet_brain.runner import Runner
+
+
+class FakeClient:
+    def __init__(self, jobs: list[dict[str, Any]], *, batch: int = 1) -> None:
+        self.jobs = list(jobs)
+        self.batch = batch
+        self.submitted: list[dict[str, Any]] = []
+        self.submit_calls: list[list[str]] = []
+        self.on_submit = lambda result: None
+
+    def capabilities(self) -> dict[str, Any]:
+        return {"batch": {"max_pull": self.batch, "max_submit": self.batch}}
+
+    def pull_job(self, *, wait_s: float = 0.0) -> dict[str, Any] | None:
+        return self.jobs.pop(0) if self.jobs else None
+
+    def pull_jobs(self, limit: int, *, wait_s: float = 0.0) -> list[dict[str, Any]]:
+        leased, self.jobs = self.jobs[:limit], self.jobs[limit:]
+        return leased
+
+    def submit_job(self, job_id: str, *, status: str, result: Any = None, error: str | None = None) -> None:
+        self.submit_calls.append([job_id])
+        self._record({"id": job_id, "status": status, "result": result, "error": error})
+
+    def submit_jobs(self, results: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        self.submit_calls.append([r["id"] for r in results])
+        for r in results:
+            self._record(r)
+        return [{"id": r["id"], "ok": True} for r in results]
+
+    def _record(self, result: dict[str, Any]) -> None:
+        self.submitted.append(result)
+        self.on_submit(result)
+
+
+class FakeGenerator:
+    def __init__(self) -> None:
+        self.release_slow = threading.Event()
+
+    def generate(self, job_type: str, job_input: dict[str, Any]) -> dict[str, Any]:
+        if job_input.get("fail"):
+            raise RuntimeError("boom")
+        if job_input.get("slow") and not self.release_slow.wait(timeout=5):
+            raise TimeoutError("slow job was never released")
+        return {"echo": job_input.get("text")}
+
+
+def _job(job_id: str, **job_input: Any) -> dict[str, Any]:
+    return {"id": job_id, "job_type": "DIALOGUE", "input": job_input}
+
+
+class TestRunner:
+    def test_single_job_path_submits_each_job(self):
+        client = FakeClient([_job("j1", text="hi"), _job("j2", fail=True)])
+        runner = Runner(client=client, generator=FakeGenerator())
+
+        assert runner.run(once=True) == 0
+        assert runner.run(once=True) == 0
+
+        assert client.submit_calls == [["j1"], ["j2"]]
+        assert client.submitted[0]["result"] == {"echo": "hi"}
+        assert client.submitted[1]["status"] == "failed"
+        assert client.submitted[1]["error"] == "boom"
+
+    def test_batch_results_are_submitted_as_they_finish(self):
+        jobs = [_job("slow", slow=True, text="z"), _job("fast", text="a"), _job("bad", fail=True)]
+        client = FakeClient(jobs, batch=3)
+        generator = FakeGenerator()
+        # The slow job only finishes once the others have been submitted.
+        client.on_submit = lambda result: len(client.submitted) == 2 and generator.release_slow.set()
+        runner = Runner(client=client, generator=generator, batch_size=3)
+
+        runner._process_batch(client.pull_jobs(3))
+
+        assert len(client.submit_calls) >= 2
+        assert client.submit_calls[-1] == ["slow"]
+        assert {r["id"]: r["status"] for r in client.submitted} == {"slow": "done", "fast": "done", "bad": "failed"}
+        assert client.submitted[-1]["result"] == {"echo": "z"}
@@ -296,6 +296,9 @@ export type BrainJobSummary = {
   last_error_code?: string | null;
   last_error_at?: string | null;
   error?: string | null;
+  // Streaming DIALOGUE: lines generated so far, before the job is done.
+  partial?: { lines?: string[] } | null;
+  partial_at?: string | null;
   created_at?: string | null;
   updated_at?: string | null;
   finished_at?: string | null;